@@ -5,7 +5,7 @@ import uuid
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
-from langgraph.graph import StateGraph, START, END
+from langgraph.graph import StateGraph, MessagesState, START, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import ToolNode, tools_condition
@@ -17,6 +17,9 @@ from .tools import AVAILABLE_TOOLS
 from .conversation_manager import ConversationManager
 from .traits import get_traits_registry
 
+# Load environment variables once at import rather than per agent instance
+load_dotenv()
+
 
 class SimpleLangGraphAgent:
     """Simplified LangGraph agent with proper tool binding."""
@@ -31,9 +34,10 @@ class SimpleLangGraphAgent:
         self.config = config
         self.user_profile = user_profile or {}
         self.last_tool_usage = []  # Track tool usage for UI indicators
+        self._traits_instructions: Optional[str] = None  # Cached by _get_traits_instructions
         
-        # Load environment variables
-        load_dotenv()
+        # Resolve configured tools once for both LLM binding and the graph
+        self.tools = self._resolve_tools()
         
         # Initialize LLM with tool binding
         self.llm = self._create_llm_with_tools()
@@ -59,9 +63,8 @@ class SimpleLangGraphAgent:
         if hasattr(config, 'traits') and config.traits:
             print(f"🎭 Traits: {', '.join(config.traits)}")
     
-    def _create_llm_with_tools(self):
-        """Create LLM with tools bound."""
-        # Get tools for this agent
+    def _resolve_tools(self) -> List[Any]:
+        """Resolve configured tool names to tool instances."""
         tools = []
         for tool_name in self.config.tools:
             if tool_name in AVAILABLE_TOOLS:
@@ -69,6 +72,10 @@ class SimpleLangGraphAgent:
             else:
                 print(f"⚠️ Tool '{tool_name}' not found")
         
+        return tools
+    
+    def _create_llm_with_tools(self):
+        """Create LLM with tools bound."""
         # Create LLM
         llm = ChatOpenAI(
             model=self.config.llm.model_name,
@@ -77,22 +84,14 @@ class SimpleLangGraphAgent:
         )
         
         # Bind tools to LLM
-        if tools:
-            llm = llm.bind_tools(tools)
-            print(f"✅ Bound {len(tools)} tools to LLM")
+        if self.tools:
+            llm = llm.bind_tools(self.tools)
+            print(f"✅ Bound {len(self.tools)} tools to LLM")
         
         return llm
     
     def _create_graph(self):
         """Create the LangGraph workflow."""
-        from langgraph.graph import MessagesState
-        
-        # Create tools node if we have tools
-        tools = []
-        for tool_name in self.config.tools:
-            if tool_name in AVAILABLE_TOOLS:
-                tools.append(AVAILABLE_TOOLS[tool_name])
-        
         # Create workflow
         workflow = StateGraph(MessagesState)
         
@@ -100,15 +99,15 @@ class SimpleLangGraphAgent:
         workflow.add_node("agent", self._agent_node)
         
         # Add tools node if we have tools
-        if tools:
-            tool_node = ToolNode(tools)
+        if self.tools:
+            tool_node = ToolNode(self.tools)
             workflow.add_node("tools", tool_node)
         
         # Set entry point
         workflow.add_edge(START, "agent")
         
         # Add conditional edges for tool calling
-        if tools:
+        if self.tools:
             workflow.add_conditional_edges(
                 "agent",
                 tools_condition,
@@ -196,10 +195,17 @@ class SimpleLangGraphAgent:
         return ". ".join(context_parts)
     
     def _get_traits_instructions(self) -> str:
-        """Generate behavioral instructions from configured traits."""
+        """Generate behavioral instructions from configured traits.
+        
+        The result is cached on the agent since the system prompt is rebuilt
+        on every LLM call but the configured traits never change.
+        """
         if not hasattr(self.config, 'traits') or not self.config.traits:
             return ""
         
+        if self._traits_instructions is not None:
+            return self._traits_instructions
+        
         try:
             traits_registry = get_traits_registry()
             instructions = traits_registry.resolve_traits(self.config.traits)
@@ -210,7 +216,8 @@ class SimpleLangGraphAgent:
                 for i, instruction in enumerate(instructions, 1):
                     formatted_instructions.append(f"{i}. {instruction}")
                 
-                return "\n".join(formatted_instructions)
+                self._traits_instructions = "\n".join(formatted_instructions)
+                return self._traits_instructions
             
         except Exception as e:
             print(f"⚠️ Error loading traits instructions: {e}")
@@ -527,14 +527,18 @@ def create(agent_name: str = typer.Argument(..., help="Name for the new agent co
         # Ensure configs directory exists
         Path("configs").mkdir(exist_ok=True)
         
+        # Write to a temp file and rename so an existing config is never left half-written
+        temp_filename = f"{config_filename}.tmp"
         try:
-            with open(config_filename, 'w', encoding='utf-8') as f:
+            with open(temp_filename, 'w', encoding='utf-8') as f:
                 yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            os.replace(temp_filename, config_filename)
             
             console.print(f"[bold green]✅ Agent configuration saved to {config_filename}[/bold green]")
             console.print(f"[dim]You can now use: agent-factory chat {agent_id}[/dim]")
             
         except Exception as e:
+            Path(temp_filename).unlink(missing_ok=True)
             console.print(f"[red]Error saving configuration: {e}[/red]")
             raise typer.Exit(1)
     else:
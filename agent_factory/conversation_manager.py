@@ -5,7 +5,44 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
-from .supabase_client import SupabaseProfileClient
+import pytz
+
+from .supabase_client import get_profile_client
+
+
+# Keyword tables used by the markdown summary heuristics
+
+# Common engineering topics
+TOPIC_KEYWORDS = {
+    "Career Development": ("career", "growth", "promotion", "advancement", "goals"),
+    "Technical Skills": ("skills", "technology", "programming", "coding", "technical"),
+    "Project Management": ("project", "deadline", "planning", "milestone", "delivery"),
+    "Team Collaboration": ("team", "collaboration", "communication", "meeting", "standup"),
+    "Performance": ("performance", "review", "feedback", "improvement", "metrics"),
+    "Leadership": ("leadership", "mentor", "guide", "lead", "responsibility"),
+    "Work-Life Balance": ("balance", "stress", "workload", "time", "schedule"),
+    "Learning": ("learning", "training", "course", "skill", "development"),
+}
+
+# Decision indicators
+DECISION_PHRASES = (
+    "we decided", "agreed to", "will do", "plan to", "decided to",
+    "going to", "next step", "action plan", "resolution",
+)
+
+# Action indicators
+ACTION_PHRASES = (
+    "action:", "todo:", "task:", "will", "need to", "should",
+    "follow up", "next week", "by", "deadline", "complete",
+)
+
+# Tool usage indicators
+TOOL_INDICATORS = {
+    "Web Search": ("search", "research", "found", "according to"),
+    "Calculator": ("calculate", "math", "result", "equals"),
+    "DateTime": ("time", "date", "schedule", "calendar"),
+    "Scheduler": ("meeting", "1:1", "appointment", "schedule"),
+}
 
 
 @dataclass
@@ -27,7 +64,7 @@ class ConversationManager:
     
     def __init__(self):
         """Initialize conversation manager."""
-        self.supabase_client = SupabaseProfileClient()
+        self.supabase_client = get_profile_client()
         self.client = self.supabase_client.client
         self.current_session: Optional[ConversationSession] = None
     
@@ -222,6 +259,9 @@ class ConversationManager:
         user_title = user_profile.get("title", "Software Engineer") if user_profile else "Software Engineer"
         user_email = user_profile.get("email", "") if user_profile else ""
         
+        # Lowercase once for the keyword-based helpers
+        content_lower = conversation_content.lower()
+        
         # Build markdown summary
         markdown_summary = f"""# 📋 Conversation Summary
 
@@ -240,7 +280,7 @@ class ConversationManager:
 ## 🎯 Key Discussion Points
 
 ### Main Topics Covered:
-{self._extract_key_topics(conversation_content)}
+{self._extract_key_topics(content_lower)}
 
 ### Decisions Made:
 {self._extract_decisions(conversation_content)}
@@ -251,10 +291,10 @@ class ConversationManager:
 ## 📊 Session Metrics
 - **Engagement Level:** {self._assess_engagement_level()}
 - **Topics Covered:** {self._count_topics_covered(conversation_content)}
-- **Tools Used:** {self._identify_tools_used(conversation_content)}
+- **Tools Used:** {self._identify_tools_used(content_lower)}
 
 ## 🔄 Next Steps
-{self._generate_next_steps(conversation_content)}
+{self._generate_next_steps(content_lower)}
 
 ---
 *📝 Summary generated by {agent_name} AI Manager*  
@@ -273,31 +313,17 @@ class ConversationManager:
         
         # If created_at is timezone-aware, make now timezone-aware too
         if created_at.tzinfo is not None and created_at.utcoffset() is not None:
-            import pytz
             now = now.replace(tzinfo=pytz.UTC)
         
         duration = now - created_at
         return max(1, int(duration.total_seconds() / 60))
     
-    def _extract_key_topics(self, content: str) -> str:
-        """Extract key topics from conversation content."""
+    def _extract_key_topics(self, content_lower: str) -> str:
+        """Extract key topics from lowercased conversation content."""
         # Simple keyword-based topic extraction
         topics = []
         
-        # Common engineering topics
-        topic_keywords = {
-            "Career Development": ["career", "growth", "promotion", "advancement", "goals"],
-            "Technical Skills": ["skills", "technology", "programming", "coding", "technical"],
-            "Project Management": ["project", "deadline", "planning", "milestone", "delivery"],
-            "Team Collaboration": ["team", "collaboration", "communication", "meeting", "standup"],
-            "Performance": ["performance", "review", "feedback", "improvement", "metrics"],
-            "Leadership": ["leadership", "mentor", "guide", "lead", "responsibility"],
-            "Work-Life Balance": ["balance", "stress", "workload", "time", "schedule"],
-            "Learning": ["learning", "training", "course", "skill", "development"]
-        }
-        
-        content_lower = content.lower()
-        for topic, keywords in topic_keywords.items():
+        for topic, keywords in TOPIC_KEYWORDS.items():
             if any(keyword in content_lower for keyword in keywords):
                 topics.append(topic)
         
@@ -308,18 +334,12 @@ class ConversationManager:
     
     def _extract_decisions(self, content: str) -> str:
         """Extract decisions from conversation content."""
-        # Look for decision indicators
-        decision_phrases = [
-            "we decided", "agreed to", "will do", "plan to", "decided to",
-            "going to", "next step", "action plan", "resolution"
-        ]
-        
         decisions = []
         lines = content.split('\n')
         
         for line in lines:
             line_lower = line.lower()
-            if any(phrase in line_lower for phrase in decision_phrases):
+            if any(phrase in line_lower for phrase in DECISION_PHRASES):
                 # Clean up the line and add as decision
                 clean_line = line.strip()
                 if len(clean_line) > 20 and len(clean_line) < 200:  # Reasonable length
@@ -332,18 +352,12 @@ class ConversationManager:
     
     def _extract_action_items(self, content: str) -> str:
         """Extract action items from conversation content."""
-        # Look for action indicators
-        action_phrases = [
-            "action:", "todo:", "task:", "will", "need to", "should",
-            "follow up", "next week", "by", "deadline", "complete"
-        ]
-        
         actions = []
         lines = content.split('\n')
         
         for line in lines:
             line_lower = line.lower()
-            if any(phrase in line_lower for phrase in action_phrases):
+            if any(phrase in line_lower for phrase in ACTION_PHRASES):
                 clean_line = line.strip()
                 if len(clean_line) > 15 and len(clean_line) < 150:
                     actions.append(clean_line)
@@ -375,19 +389,11 @@ class ConversationManager:
         
         return f"{topic_count} topics"
     
-    def _identify_tools_used(self, content: str) -> str:
-        """Identify tools used during the conversation."""
+    def _identify_tools_used(self, content_lower: str) -> str:
+        """Identify tools used from lowercased conversation content."""
         tools_used = []
         
-        tool_indicators = {
-            "Web Search": ["search", "research", "found", "according to"],
-            "Calculator": ["calculate", "math", "result", "equals"],
-            "DateTime": ["time", "date", "schedule", "calendar"],
-            "Scheduler": ["meeting", "1:1", "appointment", "schedule"]
-        }
-        
-        content_lower = content.lower()
-        for tool, keywords in tool_indicators.items():
+        for tool, keywords in TOOL_INDICATORS.items():
             if any(keyword in content_lower for keyword in keywords):
                 tools_used.append(tool)
         
@@ -396,13 +402,11 @@ class ConversationManager:
         
         return ", ".join(tools_used)
     
-    def _generate_next_steps(self, content: str) -> str:
-        """Generate suggested next steps based on conversation."""
+    def _generate_next_steps(self, content_lower: str) -> str:
+        """Generate suggested next steps from lowercased conversation content."""
         # Simple next steps based on content analysis
         next_steps = []
         
-        content_lower = content.lower()
-        
         if "goal" in content_lower or "career" in content_lower:
             next_steps.append("Schedule follow-up career development discussion")
         
@@ -31,7 +31,7 @@ class ModelsRegistry:
             models_path = Path(self.models_file)
             
             if not models_path.exists():
-                logger.error(f"Models registry file not found: {self.models_file}")
+                logger.error("Models registry file not found: %s", self.models_file)
                 return
             
             with open(models_path, 'r', encoding='utf-8') as f:
@@ -40,14 +40,14 @@ class ModelsRegistry:
             # Filter models by API key availability
             self._filter_available_models()
             
-            logger.info(f"Loaded models registry from {self.models_file}")
+            logger.info("Loaded models registry from %s", self.models_file)
             
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing models registry YAML: {e}")
+            logger.error("Error parsing models registry YAML: %s", e)
             self.models_data = {}
             self.available_models = {}
         except Exception as e:
-            logger.error(f"Error loading models registry: {e}")
+            logger.error("Error loading models registry: %s", e)
             self.models_data = {}
             self.available_models = {}
     
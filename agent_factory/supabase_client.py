@@ -270,4 +270,25 @@ class SupabaseProfileClient:
         if email:
             full_context += f"\n\nIMPORTANT: When scheduling meetings or sending calendar invites, use their email address {email}. Do not ask for their email address as you already have it."
         
-        return full_context 
\ No newline at end of file
+        return full_context
+
+
+# Shared client for conversation managers
+_profile_client: Optional[SupabaseProfileClient] = None
+
+
+def get_profile_client() -> SupabaseProfileClient:
+    """Get the Supabase client shared by conversation managers.
+    
+    Every agent owns a ConversationManager, so sharing one client reuses its
+    HTTP connection pool instead of opening a new one per conversation.
+    
+    Returns:
+        SupabaseProfileClient instance
+    """
+    global _profile_client
+    
+    if _profile_client is None:
+        _profile_client = SupabaseProfileClient()
+    
+    return _profile_client
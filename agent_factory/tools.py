@@ -1,22 +1,45 @@
 """LangChain-compatible tools for Agent Factory."""
 
 import ast
+import errno
 import operator
 import os
 import re
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import smtplib
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime, timedelta
 import pytz
 
 from langchain_core.tools import tool
 
 
+def _create_http_session() -> requests.Session:
+    """Create a shared HTTP session with connection pooling.
+    
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so search requests reuse TCP/TLS connections
+_http_session = _create_http_session()
+
+
 @tool("datetime")
 def datetime_tool(timezone: str = "") -> str:
     """Get current date, time, timezone, and day of week information.
@@ -175,26 +198,34 @@ def file_reader_tool(file_path: str) -> str:
         # Convert to Path object
         path = Path(clean_path)
         
-        # Check if file exists
-        if not path.exists():
-            return f"Error: File '{clean_path}' does not exist"
-        
+        # Stat once and reuse the result for the existence, type and size checks
+        try:
+            file_stat = path.stat()
+        except OSError as e:
+            # Path.exists() treated these as missing too; keep the same message
+            if e.errno in (errno.ENOENT, errno.ENOTDIR, errno.ELOOP):
+                return f"Error: File '{clean_path}' does not exist"
+            raise
+
         # Check if it's a file (not a directory)
-        if not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return f"Error: '{clean_path}' is not a file"
-        
+
         # Check file size (limit to 1MB for safety)
-        if path.stat().st_size > 1024 * 1024:
+        file_size = file_stat.st_size
+        if file_size > 1024 * 1024:
             return f"Error: File '{clean_path}' is too large (>1MB)"
         
-        # Read the file
+        # Read the raw bytes once so an encoding fallback doesn't re-read the file
+        raw_content = path.read_bytes()
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = raw_content.decode('utf-8')
         except UnicodeDecodeError:
             # Try with different encoding
-            with open(path, 'r', encoding='latin-1') as f:
-                content = f.read()
+            content = raw_content.decode('latin-1')
+
+        # Normalize newlines the same way text-mode reads do
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
         
         # Analyze the content
         lines = content.split('\n')
@@ -208,7 +239,7 @@ def file_reader_tool(file_path: str) -> str:
 - Lines: {len(lines)}
 - Words: {word_count}
 - Characters: {char_count}
-- Size: {path.stat().st_size} bytes
+- Size: {file_size} bytes
 
 📝 **Content Preview:**
 ```
@@ -290,32 +321,85 @@ def web_search_tool(query: str) -> str:
         return f"❌ Error performing web search: {str(e)}"
 
 
+# Recent search results keyed by normalized query, so repeated questions
+# within a conversation don't hit the search APIs again
+SEARCH_CACHE_TTL_SECONDS = 15 * 60
+SEARCH_CACHE_MAX_ENTRIES = 256
+_search_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_search_cache_lock = threading.Lock()
+
+
 def _search_web(query: str) -> List[Dict[str, Any]]:
     """Perform web search using multiple search engines.
     
+    Results are cached in-process for SEARCH_CACHE_TTL_SECONDS.
+    
     Args:
         query: Search query
         
     Returns:
         List of search results
     """
-    results = []
-    
-    # Try DuckDuckGo first (no API key required)
-    try:
-        results.extend(_search_duckduckgo(query))
-    except Exception as e:
-        print(f"⚠️ DuckDuckGo search failed: {e}")
+    cache_key = " ".join(query.lower().split())
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+        return list(cached[1])
     
-    # Try SerpAPI if available
+    results = []
+    all_succeeded = True
     serpapi_key = os.getenv("SERPAPI_KEY") or os.getenv("SERPAPI_API_KEY")
-    if serpapi_key and len(results) < 5:
+
+    if serpapi_key:
+        # DuckDuckGo's instant answers never fill the top 5 on their own, so
+        # when SerpAPI is configured both engines are queried concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            duckduckgo_future = executor.submit(_search_duckduckgo, query)
+            serpapi_future = executor.submit(_search_serpapi, query, serpapi_key)
+
+            try:
+                results.extend(duckduckgo_future.result())
+            except Exception as e:
+                print(f"⚠️ DuckDuckGo search failed: {e}")
+                all_succeeded = False
+
+            try:
+                results.extend(serpapi_future.result())
+            except Exception as e:
+                print(f"⚠️ SerpAPI search failed: {e}")
+                all_succeeded = False
+    else:
+        # DuckDuckGo needs no API key
         try:
-            results.extend(_search_serpapi(query, serpapi_key))
+            results.extend(_search_duckduckgo(query))
         except Exception as e:
-            print(f"⚠️ SerpAPI search failed: {e}")
-    
-    return results[:10]  # Limit to top 10 results
+            print(f"⚠️ DuckDuckGo search failed: {e}")
+            all_succeeded = False
+
+    # Both engines can return the same page; keep the first occurrence of each URL
+    seen_urls = set()
+    unique_results = []
+    for result in results:
+        url = result.get('url')
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        unique_results.append(result)
+
+    results = unique_results[:10]  # Limit to top 10 results
+
+    # Only cache when every engine answered, so partial results from a
+    # transient failure are retried instead of being served for the whole TTL
+    if results and all_succeeded:
+        with _search_cache_lock:
+            _search_cache.pop(cache_key, None)
+            _search_cache[cache_key] = (time.monotonic(), results)
+            if len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                _search_cache.pop(next(iter(_search_cache)), None)
+
+    return list(results)
 
 
 def _search_duckduckgo(query: str) -> List[Dict[str, Any]]:
@@ -326,47 +410,45 @@ def _search_duckduckgo(query: str) -> List[Dict[str, Any]]:
         
     Returns:
         List of search results
+        
+    Raises:
+        requests.RequestException: If the search request fails
     """
-    try:
-        # Use DuckDuckGo's instant answer API
-        url = "https://api.duckduckgo.com/"
-        params = {
-            'q': query,
-            'format': 'json',
-            'no_html': '1',
-            'skip_disambig': '1'
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        
-        # Extract abstract if available
-        if data.get('Abstract'):
+    # Use DuckDuckGo's instant answer API
+    url = "https://api.duckduckgo.com/"
+    params = {
+        'q': query,
+        'format': 'json',
+        'no_html': '1',
+        'skip_disambig': '1'
+    }
+    
+    response = _http_session.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    data = response.json()
+    
+    results = []
+    
+    # Extract abstract if available
+    if data.get('Abstract'):
+        results.append({
+            'title': data.get('Heading', query),
+            'snippet': data.get('Abstract'),
+            'url': data.get('AbstractURL', ''),
+            'source': 'DuckDuckGo'
+        })
+    
+    # Extract related topics
+    for topic in data.get('RelatedTopics', [])[:3]:
+        if isinstance(topic, dict) and 'Text' in topic:
             results.append({
-                'title': data.get('Heading', query),
-                'snippet': data.get('Abstract'),
-                'url': data.get('AbstractURL', ''),
+                'title': topic.get('Text', '')[:100],
+                'snippet': topic.get('Text', ''),
+                'url': topic.get('FirstURL', ''),
                 'source': 'DuckDuckGo'
             })
-        
-        # Extract related topics
-        for topic in data.get('RelatedTopics', [])[:3]:
-            if isinstance(topic, dict) and 'Text' in topic:
-                results.append({
-                    'title': topic.get('Text', '')[:100],
-                    'snippet': topic.get('Text', ''),
-                    'url': topic.get('FirstURL', ''),
-                    'source': 'DuckDuckGo'
-                })
-        
-        return results
-        
-    except Exception as e:
-        print(f"DuckDuckGo search error: {e}")
-        return []
+    
+    return results
 
 
 def _search_serpapi(query: str, api_key: str) -> List[Dict[str, Any]]:
@@ -378,34 +460,32 @@ def _search_serpapi(query: str, api_key: str) -> List[Dict[str, Any]]:
         
     Returns:
         List of search results
-    """
-    try:
-        url = "https://serpapi.com/search"
-        params = {
-            'q': query,
-            'api_key': api_key,
-            'engine': 'google',
-            'num': 5
-        }
-        
-        response = requests.get(url, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        results = []
-        for item in data.get('organic_results', []):
-            results.append({
-                'title': item.get('title', ''),
-                'snippet': item.get('snippet', ''),
-                'url': item.get('link', ''),
-                'source': 'Google'
-            })
         
-        return results
-        
-    except Exception as e:
-        print(f"SerpAPI search error: {e}")
-        return []
+    Raises:
+        requests.RequestException: If the search request fails
+    """
+    url = "https://serpapi.com/search"
+    params = {
+        'q': query,
+        'api_key': api_key,
+        'engine': 'google',
+        'num': 5
+    }
+    
+    response = _http_session.get(url, params=params, timeout=15)
+    response.raise_for_status()
+    data = response.json()
+    
+    results = []
+    for item in data.get('organic_results', []):
+        results.append({
+            'title': item.get('title', ''),
+            'snippet': item.get('snippet', ''),
+            'url': item.get('link', ''),
+            'source': 'Google'
+        })
+    
+    return results
 
 
 def _synthesize_results(query: str, results: List[Dict[str, Any]], llm) -> str:
@@ -420,13 +500,14 @@ def _synthesize_results(query: str, results: List[Dict[str, Any]], llm) -> str:
         AI-synthesized summary
     """
     # Prepare context for AI synthesis
-    context = f"Search Query: {query}\n\nSearch Results:\n"
+    context_parts = [f"Search Query: {query}\n\nSearch Results:\n"]
     for i, result in enumerate(results[:5], 1):
-        context += f"{i}. {result['title']}\n"
-        context += f"   {result['snippet']}\n"
+        context_parts.append(f"{i}. {result['title']}\n")
+        context_parts.append(f"   {result['snippet']}\n")
         if result['url']:
-            context += f"   Source: {result['url']}\n"
-        context += "\n"
+            context_parts.append(f"   Source: {result['url']}\n")
+        context_parts.append("\n")
+    context = "".join(context_parts)
     
     # Create synthesis prompt
     prompt = f"""Based on the following search results, provide a comprehensive and accurate summary that answers the query: "{query}"
@@ -466,17 +547,17 @@ def _format_raw_results(query: str, results: List[Dict[str, Any]]) -> str:
     Returns:
         Formatted search results
     """
-    response = f"🔍 **Web Search Results for: \"{query}\"**\n\n"
+    response_parts = [f"🔍 **Web Search Results for: \"{query}\"**\n\n"]
     
     for i, result in enumerate(results[:5], 1):
-        response += f"**{i}. {result['title']}**\n"
-        response += f"{result['snippet']}\n"
+        response_parts.append(f"**{i}. {result['title']}**\n")
+        response_parts.append(f"{result['snippet']}\n")
         if result['url']:
-            response += f"🔗 Source: {result['url']}\n"
-        response += "\n"
+            response_parts.append(f"🔗 Source: {result['url']}\n")
+        response_parts.append("\n")
     
-    response += f"Found {len(results)} results total."
-    return response
+    response_parts.append(f"Found {len(results)} results total.")
+    return "".join(response_parts)
 
 
 @tool("one_on_one_scheduler")
@@ -564,6 +645,33 @@ Meeting scheduled! 📅"""
         return f"❌ Error scheduling meeting: {str(e)}"
 
 
+# Scheduling regexes, compiled once at import
+DECIMAL_NUMBER_PATTERN = re.compile(r'(\d+(?:\.\d+)?)')
+INTEGER_PATTERN = re.compile(r'(\d+)')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Day references in priority order: when several appear, the earliest entry wins
+DAY_REFERENCES = {
+    'next monday': 'next Monday',
+    'next tuesday': 'next Tuesday',
+    'next wednesday': 'next Wednesday',
+    'next thursday': 'next Thursday',
+    'next friday': 'next Friday',
+    'monday': 'Monday',
+    'tuesday': 'Tuesday',
+    'wednesday': 'Wednesday',
+    'thursday': 'Thursday',
+    'friday': 'Friday',
+    'tomorrow': 'tomorrow',
+}
+DAY_REFERENCE_PRIORITY = {reference: index for index, reference in enumerate(DAY_REFERENCES)}
+DAY_REFERENCE_PATTERN = re.compile(r'\b(' + '|'.join(DAY_REFERENCES) + r')\b')
+TIME_PATTERNS = (
+    re.compile(r'\b(\d{1,2}):(\d{2})\s*(am|pm)\b'),
+    re.compile(r'\b(\d{1,2})\s*(am|pm)\b'),
+)
+DURATION_PATTERN = re.compile(r'(\d+)\s*(?:minutes?|mins?)')
+
+
 def _parse_duration(duration_input: Any) -> int:
     """Parse duration input into minutes.
     
@@ -582,17 +690,17 @@ def _parse_duration(duration_input: Any) -> int:
         
         # Extract number and unit
         if 'hour' in duration_str:
-            match = re.search(r'(\d+(?:\.\d+)?)', duration_str)
+            match = DECIMAL_NUMBER_PATTERN.search(duration_str)
             if match:
                 hours = float(match.group(1))
                 return int(hours * 60)
         elif 'min' in duration_str:
-            match = re.search(r'(\d+)', duration_str)
+            match = INTEGER_PATTERN.search(duration_str)
             if match:
                 return int(match.group(1))
         else:
             # Try to extract just a number
-            match = re.search(r'(\d+)', duration_str)
+            match = INTEGER_PATTERN.search(duration_str)
             if match:
                 return int(match.group(1))
     
@@ -610,41 +718,22 @@ def _parse_meeting_request(text: str) -> Dict[str, Any]:
         Dictionary with extracted meeting details
     """
     data = {}
+    lowered_text = text.lower()
     
     # Extract email addresses
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
+    emails = EMAIL_PATTERN.findall(text)
     if emails:
         data['employee_email'] = emails[0]  # First email found
     
-    # Extract day references
-    day_patterns = {
-        r'\bnext monday\b': 'next Monday',
-        r'\bnext tuesday\b': 'next Tuesday', 
-        r'\bnext wednesday\b': 'next Wednesday',
-        r'\bnext thursday\b': 'next Thursday',
-        r'\bnext friday\b': 'next Friday',
-        r'\bmonday\b': 'Monday',
-        r'\btuesday\b': 'Tuesday',
-        r'\bwednesday\b': 'Wednesday', 
-        r'\bthursday\b': 'Thursday',
-        r'\bfriday\b': 'Friday',
-        r'\btomorrow\b': 'tomorrow',
-    }
-    
-    for pattern, day in day_patterns.items():
-        if re.search(pattern, text.lower()):
-            data['date'] = day
-            break
+    # Extract day references with a single scan, keeping the highest-priority match
+    day_matches = DAY_REFERENCE_PATTERN.findall(lowered_text)
+    if day_matches:
+        best_match = min(day_matches, key=DAY_REFERENCE_PRIORITY.__getitem__)
+        data['date'] = DAY_REFERENCES[best_match]
     
     # Extract time
-    time_patterns = [
-        r'\b(\d{1,2}):(\d{2})\s*(am|pm)\b',
-        r'\b(\d{1,2})\s*(am|pm)\b',
-    ]
-    
-    for pattern in time_patterns:
-        match = re.search(pattern, text.lower())
+    for pattern in TIME_PATTERNS:
+        match = pattern.search(lowered_text)
         if match:
             if len(match.groups()) == 3:  # HH:MM AM/PM
                 hour, minute, ampm = match.groups()
@@ -655,13 +744,21 @@ def _parse_meeting_request(text: str) -> Dict[str, Any]:
             break
     
     # Extract duration
-    duration_match = re.search(r'(\d+)\s*(?:minutes?|mins?)', text.lower())
+    duration_match = DURATION_PATTERN.search(lowered_text)
     if duration_match:
         data['duration'] = int(duration_match.group(1))
     
     return data
 
 
+# Weekday lookups shared by the scheduling helpers
+WEEKDAY_INDEX = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+WORKDAY_NAMES = frozenset({'monday', 'tuesday', 'wednesday', 'thursday', 'friday'})
+
+
 def _parse_meeting_datetime(date_str: str, time_str: str) -> Optional[datetime]:
     """Parse date and time strings into datetime object.
     
@@ -678,13 +775,14 @@ def _parse_meeting_datetime(date_str: str, time_str: str) -> Optional[datetime]:
         now = datetime.now(tz)
         
         # Parse date
-        if date_str.lower() == 'tomorrow':
+        date_lower = date_str.lower()
+        if date_lower == 'tomorrow':
             meeting_date = now + timedelta(days=1)
-        elif date_str.lower().startswith('next '):
-            day_name = date_str.lower().replace('next ', '')
+        elif date_lower.startswith('next '):
+            day_name = date_lower.replace('next ', '')
             meeting_date = _get_next_weekday(day_name, tz)
-        elif date_str.lower() in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']:
-            meeting_date = _get_next_weekday(date_str.lower(), tz)
+        elif date_lower in WORKDAY_NAMES:
+            meeting_date = _get_next_weekday(date_lower, tz)
         else:
             # Try to parse specific date
             try:
@@ -735,12 +833,7 @@ def _get_next_weekday(day_name: str, tz: pytz.timezone) -> datetime:
     Returns:
         datetime object for next occurrence
     """
-    days = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-    
-    target_day = days.get(day_name.lower())
+    target_day = WEEKDAY_INDEX.get(day_name.lower())
     if target_day is None:
         return None
     
@@ -29,19 +29,19 @@ class TraitsRegistry:
             traits_path = Path(self.traits_file)
             
             if not traits_path.exists():
-                logger.error(f"Traits registry file not found: {self.traits_file}")
+                logger.error("Traits registry file not found: %s", self.traits_file)
                 return
             
             with open(traits_path, 'r', encoding='utf-8') as f:
                 self.traits_data = yaml.safe_load(f) or {}
             
-            logger.info(f"Loaded traits registry from {self.traits_file}")
+            logger.info("Loaded traits registry from %s", self.traits_file)
             
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing traits registry YAML: {e}")
+            logger.error("Error parsing traits registry YAML: %s", e)
             self.traits_data = {}
         except Exception as e:
-            logger.error(f"Error loading traits registry: {e}")
+            logger.error("Error loading traits registry: %s", e)
             self.traits_data = {}
     
     def resolve_traits(self, trait_names: List[str]) -> List[str]:
@@ -64,7 +64,7 @@ class TraitsRegistry:
             if instruction:
                 instructions.append(instruction)
             else:
-                logger.warning(f"Trait '{trait_name}' not found in registry, skipping")
+                logger.warning("Trait '%s' not found in registry, skipping", trait_name)
         
         return instructions
     
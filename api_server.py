@@ -8,12 +8,15 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import asyncio
 import uvicorn
 import os
 import sys
+import threading
 import time
+import traceback
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, List
 
@@ -37,44 +40,109 @@ except ImportError as e:
 # Global agent instance
 emreq_agent = None
 
+# Emreq agent configuration, loaded once and shared by all agent instances
+EMREQ_CONFIG_PATH = "configs/engineering_manager_emreq.yaml"
+emreq_config = None
+
+def get_emreq_config():
+    """Get the Emreq agent configuration, loading and validating it on first use."""
+    global emreq_config
+    
+    if emreq_config is None:
+        emreq_config = load_config(EMREQ_CONFIG_PATH)
+    
+    return emreq_config
+
 # Conversation-specific agent cache - one agent per conversation
 conversation_agents = {}
 
+# Per-conversation locks guarding each agent's creation, turns and removal
+conversation_locks = {}
+
+@contextmanager
+def hold_conversation_lock(conversation_id: str):
+    """Hold the lock that serializes all work on one conversation's agent.
+    
+    _remove_conversation_agent drops a conversation's lock while holding it,
+    so a thread that was waiting on the dropped lock retries with the
+    current one instead of racing a newer request that already took it.
+    """
+    while True:
+        lock = conversation_locks.setdefault(conversation_id, threading.Lock())
+        lock.acquire()
+        if conversation_locks.get(conversation_id) is lock:
+            break
+        lock.release()
+    try:
+        yield
+    finally:
+        lock.release()
+
 def get_conversation_agent(conversation_id: str, user_id: str, user_profile: Optional[dict] = None):
     """Get or create a conversation-specific agent instance.
     
     This implements the recommended LangGraph pattern of one agent per conversation.
     Each conversation gets its own thread_id and agent instance for proper memory isolation.
     """
-    if conversation_id not in conversation_agents:
-        # Create new agent for this conversation
-        config_path = "configs/engineering_manager_emreq.yaml"
-        config = load_config(config_path)
-        
-        # Create agent with conversation-specific thread_id
-        conversation_agent = SimpleLangGraphAgent(config, user_profile)
-        
-        # Set the thread_id to the conversation_id for LangGraph memory
-        conversation_agent.thread_id = conversation_id
-        
-        # Start conversation session
-        conversation_agent.start_conversation(user_id, "Chat with Emreq")
+    # Concurrent first requests for one conversation must share a single agent
+    with hold_conversation_lock(conversation_id):
+        if conversation_id not in conversation_agents:
+            # Create new agent for this conversation
+            config = get_emreq_config()
+            
+            # Create agent with conversation-specific thread_id
+            conversation_agent = SimpleLangGraphAgent(config, user_profile)
+            
+            # Set the thread_id to the conversation_id for LangGraph memory
+            conversation_agent.thread_id = conversation_id
+            
+            # Start conversation session
+            conversation_agent.start_conversation(user_id, "Chat with Emreq")
+            
+            # Cache the agent
+            conversation_agents[conversation_id] = conversation_agent
+            print(f"✅ Created new agent for conversation: {conversation_id} (user: {user_id})")
+        else:
+            # Update user profile if provided
+            if user_profile and hasattr(conversation_agents[conversation_id], 'user_profile'):
+                conversation_agents[conversation_id].user_profile = user_profile
         
-        # Cache the agent
-        conversation_agents[conversation_id] = conversation_agent
-        print(f"✅ Created new agent for conversation: {conversation_id} (user: {user_id})")
-    else:
-        # Update user profile if provided
-        if user_profile and hasattr(conversation_agents[conversation_id], 'user_profile'):
-            conversation_agents[conversation_id].user_profile = user_profile
+        return conversation_agents[conversation_id]
+
+def run_conversation_turn(conversation_id: str, conversation_agent, message: str):
+    """Run one chat turn and collect its tool usage.
     
-    return conversation_agents[conversation_id]
+    Called from worker threads, so turns for the same conversation are
+    serialized to keep the agent's memory and tool tracking consistent.
+    """
+    with hold_conversation_lock(conversation_id):
+        response = conversation_agent.chat(message)
+        tool_usage = []
+        if hasattr(conversation_agent, 'get_last_tool_usage'):
+            tool_usage = conversation_agent.get_last_tool_usage()
+    return response, tool_usage
+
+def finish_conversation(conversation_id: str, conversation_agent, summary: Optional[str] = None) -> bool:
+    """End a conversation's session and drop its cached agent.
+    
+    Waits for any in-flight turn so the session isn't ended mid-response.
+    """
+    with hold_conversation_lock(conversation_id):
+        success = conversation_agent.end_conversation(summary)
+        _remove_conversation_agent(conversation_id)
+    return success
 
 def clear_conversation_agent(conversation_id: str):
     """Clear cached agent for a conversation when it ends."""
+    with hold_conversation_lock(conversation_id):
+        _remove_conversation_agent(conversation_id)
+
+def _remove_conversation_agent(conversation_id: str):
+    """Remove a conversation's agent and its lock; caller must hold the lock."""
     if conversation_id in conversation_agents:
         del conversation_agents[conversation_id]
         print(f"🗑️ Cleared agent cache for conversation: {conversation_id}")
+    conversation_locks.pop(conversation_id, None)
 
 def get_user_agent(user_id: str, user_profile: Optional[dict] = None):
     """Legacy function - now redirects to conversation-based approach.
@@ -158,9 +226,9 @@ async def lifespan(app: FastAPI):
     else:
         try:
             # Load the Emreq agent configuration using the correct function
-            config_path = "configs/engineering_manager_emreq.yaml"
+            config_path = EMREQ_CONFIG_PATH
             if os.path.exists(config_path):
-                config = load_config(config_path)
+                config = get_emreq_config()
                 if config:
                     emreq_agent = SimpleLangGraphAgent(config)
                     print(f"✅ Loaded Emreq agent from {config_path}")
@@ -170,7 +238,6 @@ async def lifespan(app: FastAPI):
                 print(f"⚠️  Config file not found at {config_path}")
         except Exception as e:
             print(f"❌ Error loading agent: {e}")
-            import traceback
             traceback.print_exc()
     
     yield  # Server runs here
@@ -291,21 +358,20 @@ async def chat(request: ChatRequest):
         conversation_id = request.conversation_id
         if not conversation_id:
             # Generate a new conversation ID
-            import uuid
             conversation_id = str(uuid.uuid4())
             print(f"🆕 Starting new conversation: {conversation_id}")
         
         # Get or create conversation-specific agent (implements LangGraph best practices)
-        conversation_agent = get_conversation_agent(conversation_id, request.user_id, user_profile)
+        # Agent creation and chat block on network I/O, so run them off the event loop
+        conversation_agent = await asyncio.to_thread(get_conversation_agent, conversation_id, request.user_id, user_profile)
         
         # Use the conversation-specific agent to process the message
-        response = conversation_agent.chat(request.message)
+        response, tool_usage = await asyncio.to_thread(run_conversation_turn, conversation_id, conversation_agent, request.message)
         
         # Get tool usage information
         tools_used = []
         tool_execution_info = []
-        if hasattr(conversation_agent, 'get_last_tool_usage'):
-            tool_usage = conversation_agent.get_last_tool_usage()
+        if tool_usage:
             for tool_info in tool_usage:
                 tools_used.append(tool_info.get("name", "unknown"))
                 tool_execution_info.append({
@@ -325,7 +391,6 @@ async def chat(request: ChatRequest):
         
     except Exception as e:
         print(f"Error processing chat request: {e}")
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=500, 
@@ -366,31 +431,33 @@ async def chat_stream(request: ChatRequest):
             conversation_id = request.conversation_id
             if not conversation_id:
                 # Generate a new conversation ID
-                import uuid
                 conversation_id = str(uuid.uuid4())
                 print(f"🆕 Starting new conversation: {conversation_id}")
             
             # Get or create conversation-specific agent (implements LangGraph best practices)
             conversation_agent = get_conversation_agent(conversation_id, request.user_id, user_profile)
             
-            # If agent supports streaming
-            if hasattr(conversation_agent, 'chat_stream'):
-                print("Using agent chat_stream method")
-                for chunk in conversation_agent.chat_stream(request.message):
-                    print(f"Yielding chunk: {chunk[:50]}...")
-                    yield chunk
-            else:
-                # Fallback: simulate streaming by yielding full response
-                print("Using fallback word-by-word streaming")
-                response = conversation_agent.chat(request.message)
-                print(f"Full response length: {len(response)} chars")
-                
-                # Split into words and yield gradually for better UX
-                words = response.split(' ')
-                for i, word in enumerate(words):
-                    chunk = word + (' ' if i < len(words) - 1 else '')
-                    print(f"Yielding word {i+1}/{len(words)}: {word}")
-                    yield chunk
+            # Produce the whole response under the conversation lock, but release it
+            # before yielding so a slow reader can't keep the lock (and the worker
+            # threads of turns waiting on it) tied up
+            with hold_conversation_lock(conversation_id):
+                # If agent supports streaming
+                if hasattr(conversation_agent, 'chat_stream'):
+                    print("Using agent chat_stream method")
+                    chunks = list(conversation_agent.chat_stream(request.message))
+                else:
+                    # Fallback: simulate streaming by yielding full response
+                    print("Using fallback word-by-word streaming")
+                    response = conversation_agent.chat(request.message)
+                    print(f"Full response length: {len(response)} chars")
+                    
+                    # Split into words and yield gradually for better UX
+                    words = response.split(' ')
+                    chunks = [word + (' ' if i < len(words) - 1 else '') for i, word in enumerate(words)]
+            
+            for chunk in chunks:
+                print(f"Yielding chunk: {chunk[:50]}...")
+                yield chunk
                     
         except Exception as e:
             error_msg = f"Error: {str(e)}"
@@ -415,16 +482,15 @@ async def get_conversation_history(user_id: str, limit: int = 5):
     
     try:
         # Create a temporary agent instance to access conversation manager
-        config_path = "configs/engineering_manager_emreq.yaml"
-        config = load_config(config_path)
-        temp_agent = SimpleLangGraphAgent(config)
+        config = get_emreq_config()
+        temp_agent = await asyncio.to_thread(SimpleLangGraphAgent, config)
         
         # Check if the agent has a conversation manager
         if hasattr(temp_agent, 'conversation_manager') and temp_agent.conversation_manager:
-            sessions = temp_agent.conversation_manager.get_recent_sessions(user_id, limit)
+            sessions = await asyncio.to_thread(temp_agent.conversation_manager.get_recent_sessions, user_id, limit)
             
             # Clean up stale conversations and correct their status
-            corrected_sessions = cleanup_stale_conversations(temp_agent, user_id, sessions)
+            corrected_sessions = await asyncio.to_thread(cleanup_stale_conversations, temp_agent, user_id, sessions)
             
             # Convert to dict for JSON response
             session_data = []
@@ -463,10 +529,8 @@ async def complete_conversation(user_id: str, conversation_id: Optional[str] = N
         # Get the conversation's agent if it exists
         if conversation_id in conversation_agents:
             conversation_agent = conversation_agents[conversation_id]
-            success = conversation_agent.end_conversation(summary)
-            
-            # Clear the conversation's agent cache
-            clear_conversation_agent(conversation_id)
+            # Ends the session and clears the conversation's agent cache
+            success = await asyncio.to_thread(finish_conversation, conversation_id, conversation_agent, summary)
             
             if success:
                 return {"message": "Conversation completed successfully", "conversation_id": conversation_id}
@@ -503,6 +567,40 @@ async def list_tools():
         "count": len(available_tools)
     }
 
+# Input parameter name for each LangChain tool. None means read it from the
+# tool's args_schema; tools not listed take a generic "input" parameter.
+TOOL_INPUT_PARAMS = {
+    "web_search": "query",
+    "one_on_one_scheduler": "request",
+    "datetime": None,
+    "calculator": None,
+    "file_reader": None,
+}
+
+def get_tool_input_param(tool, tool_name: str) -> str:
+    """Look up the parameter name a tool expects its input under."""
+    param_name = TOOL_INPUT_PARAMS.get(tool_name, "input")
+    if param_name is None:
+        # These tools have different parameter names, check the tool's args_schema
+        param_name = "input"
+        if hasattr(tool, 'args_schema') and tool.args_schema:
+            field_names = list(tool.args_schema.model_fields.keys())
+            if field_names:
+                param_name = field_names[0]  # Use first parameter
+    return param_name
+
+def run_tool(tool, tool_name: str, tool_input: str) -> str:
+    """Invoke a tool synchronously with the raw input string."""
+    # Execute the tool using LangChain invoke method
+    if hasattr(tool, 'invoke'):
+        # New LangChain tool format
+        return tool.invoke({get_tool_input_param(tool, tool_name): tool_input})
+    elif hasattr(tool, 'execute'):
+        # Legacy tool format
+        return tool.execute(tool_input)
+    else:
+        return f"Tool {tool_name} does not have a supported execution method"
+
 @app.post("/api/tools/{tool_name}", response_model=ToolResponse)
 async def execute_tool(tool_name: str, request: ToolRequest):
     """Execute a specific tool with input data"""
@@ -529,31 +627,8 @@ async def execute_tool(tool_name: str, request: ToolRequest):
             # Use the web_search_tool directly
             tool = web_search_tool
         
-        # Execute the tool using LangChain invoke method
-        if hasattr(tool, 'invoke'):
-            # New LangChain tool format
-            if tool_name == "web_search":
-                result = tool.invoke({"query": request.input})
-            elif tool_name == "one_on_one_scheduler":
-                result = tool.invoke({"request": request.input})
-            elif tool_name in ["datetime", "calculator", "file_reader"]:
-                # These tools have different parameter names, check the tool's args_schema
-                if hasattr(tool, 'args_schema') and tool.args_schema:
-                    field_names = list(tool.args_schema.model_fields.keys())
-                    if field_names:
-                        param_name = field_names[0]  # Use first parameter
-                        result = tool.invoke({param_name: request.input})
-                    else:
-                        result = tool.invoke({"input": request.input})
-                else:
-                    result = tool.invoke({"input": request.input})
-            else:
-                result = tool.invoke({"input": request.input})
-        elif hasattr(tool, 'execute'):
-            # Legacy tool format
-            result = tool.execute(request.input)
-        else:
-            result = f"Tool {tool_name} does not have a supported execution method"
+        # Tools may do network or file I/O, so run them off the event loop
+        result = await asyncio.to_thread(run_tool, tool, tool_name, request.input)
         
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
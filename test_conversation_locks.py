@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Test that per-conversation locking creates one agent per conversation."""
+
+import os
+import sys
+import threading
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import api_server
+
+
+class StubAgent:
+    """Stand-in for SimpleLangGraphAgent that records how often it is built."""
+
+    created = []
+    end_entered = threading.Event()
+    end_gate = threading.Event()
+
+    def __init__(self, config, user_profile=None):
+        # Slow construction widens the window for a second creator to race in
+        time.sleep(0.2)
+        self.user_profile = user_profile
+        self.thread_id = None
+        StubAgent.created.append(self)
+
+    def start_conversation(self, user_id, title):
+        pass
+
+    def end_conversation(self, summary=None):
+        StubAgent.end_entered.set()
+        StubAgent.end_gate.wait(timeout=5)
+        return True
+
+
+def test_single_agent_created_across_completion(monkeypatch):
+    """A waiter on a completed conversation's lock must not build a second agent."""
+    monkeypatch.setattr(api_server, "SimpleLangGraphAgent", StubAgent)
+    monkeypatch.setattr(api_server, "get_emreq_config", lambda: None)
+    monkeypatch.setattr(api_server, "conversation_agents", {})
+    monkeypatch.setattr(api_server, "conversation_locks", {})
+
+    conversation_id = "conversation-1"
+    first_agent = api_server.get_conversation_agent(conversation_id, "user-1")
+    assert len(StubAgent.created) == 1
+
+    results = {}
+
+    def request(name):
+        results[name] = api_server.get_conversation_agent(conversation_id, "user-1")
+
+    # Complete the conversation, and queue a request behind the completion's lock
+    completion = threading.Thread(
+        target=api_server.finish_conversation, args=(conversation_id, first_agent, None)
+    )
+    completion.start()
+    assert StubAgent.end_entered.wait(timeout=5)
+
+    waiting_request = threading.Thread(target=request, args=("waiting",))
+    waiting_request.start()
+    time.sleep(0.1)
+
+    # Once the completion drops its lock, a brand new request overlaps the waiter
+    StubAgent.end_gate.set()
+    completion.join(timeout=5)
+    new_request = threading.Thread(target=request, args=("new",))
+    new_request.start()
+
+    waiting_request.join(timeout=5)
+    new_request.join(timeout=5)
+
+    assert len(StubAgent.created) == 2
+    assert results["waiting"] is results["new"]
+    assert api_server.conversation_agents[conversation_id] is results["new"]